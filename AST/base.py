@@ -2,8 +2,11 @@ from typing import Dict, Iterable, Optional, Callable, List, Type, Union
 from abc import ABC, abstractmethod
 from inspect import getfullargspec
 from functools import wraps
+from copy import copy
+import sys
 
 forward_declarations = {}
+operator_fast_paths = {}
 class_class_created = False
 
 LocalsType = Dict[str, Union[Type["Object"], Type["IComputable"], str]]
@@ -53,18 +56,24 @@ class Object(Exception):
 
 
 class IComputable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def eval(self, scope_path: tuple) -> Type[Object]:
         pass
 
 
 class IAssignable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def set_value(self, scope_path: tuple, value: Type[Object]) -> None:
         pass
 
 
 class Call(IComputable):
+    __slots__ = ()
+
     @staticmethod
     def do_call(function: "Function",
                 new_locals: Dict[str, Object]):
@@ -76,6 +85,8 @@ class Call(IComputable):
 
 
 class Constant(IComputable):
+    __slots__ = ('value',)
+
     def __init__(self, value: Type[Object]) -> None:
         self.value = value
 
@@ -83,6 +94,13 @@ class Constant(IComputable):
         return self.value
 
 
+class FoldedConstant(Constant):  # A value computed at parse time, boxed anew on every eval like its expression was
+    __slots__ = ()
+
+    def eval(self, scope_path: tuple) -> Type[Object]:
+        return type(self.value)(self.value.value)
+
+
 class Scope:
     scope_n = 0
 
@@ -146,6 +164,8 @@ class CreateScope:
 
 
 class Variable(IComputable, IAssignable):
+    __slots__ = ('name',)
+
     table = Scope()
 
     def __init__(self, name: str) -> None:
@@ -309,6 +329,8 @@ class ConstructorCall(Call):
 
 
 class MemberAccess(IComputable, IAssignable):
+    __slots__ = ('object', 'name')
+
     def __init__(self, object: Type[IComputable], name: str) -> None:
         self.object = object
         self.name = name
@@ -454,6 +476,8 @@ def create_locals(func: Function,
 
 
 class FunctionCall(Call):
+    __slots__ = ('function', 'args', 'kwargs')
+
     def __init__(self,
                  function: Type[IComputable],
                  args: Iterable[IComputable],
@@ -517,23 +541,54 @@ def resolve_overload(operator_name, objects):
 
 
 class OperatorCall(Call):
+    __slots__ = ('name', 'arguments')
+
     def __init__(self, name: str, arguments: Iterable[Type[IComputable]]) -> None:
         self.name = name
         self.arguments = arguments
 
     def eval(self, scope_path: tuple) -> Type[Object]:
-        objs = [arg.eval(scope_path) for arg in self.arguments]
+        arguments = self.arguments
+        if len(arguments) == 2:
+            return binary_operation(self.name,
+                                    arguments[0].eval(scope_path),
+                                    arguments[1].eval(scope_path))
+        return operate(self.name, [arg.eval(scope_path) for arg in arguments])
 
-        f, position, owner = resolve_overload(self.name, objs)
-        if f is None:
-            raise f"Cant perform {self.name} on objects of types\
-                    {', '.join([str(obj.type) for obj in objs])}"
 
-        del objs[position]
+class NaryOperatorCall(Call):  # operands[0] names[0] operands[1] names[1] ..., grouped to the left
+    __slots__ = ('names', 'operands')
 
-        new_locals = create_locals(f, objs, forward_declarations["dict"]({}), object=owner)
+    def __init__(self, names: List[str], operands: List[Type[IComputable]]) -> None:
+        self.names = names
+        self.operands = operands
 
-        return Call.do_call(f, new_locals)
+    def eval(self, scope_path: tuple) -> Type[Object]:
+        operands = iter(self.operands)
+        result = next(operands).eval(scope_path)
+        for name, operand in zip(self.names, operands):
+            result = binary_operation(name, result, operand.eval(scope_path))
+        return result
+
+
+def binary_operation(name: str, left: Type[Object], right: Type[Object]) -> Type[Object]:
+    fast_path = operator_fast_paths.get((name, type(left), type(right)))
+    if fast_path is not None:
+        return fast_path(left, right)
+    return operate(name, [left, right])
+
+
+def operate(name: str, objs: List[Type[Object]]) -> Type[Object]:
+    f, position, owner = resolve_overload(name, objs)
+    if f is None:
+        raise f"Cant perform {name} on objects of types\
+                {', '.join([str(obj.type) for obj in objs])}"
+
+    del objs[position]
+
+    new_locals = create_locals(f, objs, forward_declarations["dict"]({}), object=owner)
+
+    return Call.do_call(f, new_locals)
 
 
 class NoneType(IPrimitiveType):
@@ -576,6 +631,40 @@ def unpack(obj: Type[Object]):
         return list(obj)
 
 
+def node_fields(node) -> List[str]:
+    fields = [name for cls in type(node).__mro__ for name in getattr(cls, "__slots__", ())]
+    return fields + list(getattr(node, "__dict__", ()))
+
+
+def walk(node) -> Iterable:
+    if isinstance(node, (list, tuple)):
+        for value in node:
+            yield from walk(value)
+    elif isinstance(node, dict):
+        for value in node.values():
+            yield from walk(value)
+    elif isinstance(node, (IComputable, IAssignable)):
+        yield node
+        if not isinstance(node, Constant):
+            for name in node_fields(node):
+                yield from walk(getattr(node, name))
+
+
+def transform(node, function: Callable):  # Rebuilds the tree bottom-up, applying function to every node
+    if isinstance(node, (list, tuple)):
+        return type(node)(transform(value, function) for value in node)
+    if isinstance(node, dict):
+        return {key: transform(value, function) for key, value in node.items()}
+    if not isinstance(node, (IComputable, IAssignable)):
+        return node
+    if isinstance(node, Constant):
+        return function(node)
+    result = copy(node)
+    for name in node_fields(node):
+        setattr(result, name, transform(getattr(node, name), function))
+    return function(result)
+
+
 def register_class(name: str, cls, type: Class) -> None:
     Variable.table[(name,)] = type
     forward_declarations[name] = cls
@@ -585,6 +674,10 @@ def register_function(name, func):
     Variable.table[(name,)] = func
 
 
+def register_operator(name: str, left_type, right_type, func: Callable) -> None:
+    operator_fast_paths[(sys.intern(name), left_type, right_type)] = func
+
+
 class_class = Class("ClassType", {})
 function_class = Class("FunctionType", {})
 
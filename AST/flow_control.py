@@ -170,6 +170,21 @@ class ListComprehension(IPrimitiveType):
         self.conditions = conditions
         super().__init__(list_comp_class)
 
+    def __iter__(self):  # Bypasses the #iter/#next calls when iterated from Python
+        if isinstance(self.head, ContainsOperation):
+            target = self.head.value
+            for value in self.head.iterable.eval(self.scope):
+                target.set_value(self.scope, value)
+                try:
+                    if not all(cond.eval(self.scope) for cond in self.conditions):
+                        continue
+                    result = self.operation.eval(self.scope)
+                except Object as e:  # Same translation as Object.__next__
+                    if e.type.name == "StopIteration":
+                        return
+                    raise e
+                yield result
+
 
 def list_comp_iter(this: ListComprehension) -> ListComprehension:
     if isinstance(this.head, ContainsOperation):
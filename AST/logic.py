@@ -4,6 +4,8 @@ from typing import Type
 
 
 class Bool(IPrimitiveType):
+    __slots__ = ('value',)
+
     def __init__(self, value: bool = False) -> None:
         self.value = value
         super().__init__(bool_class)
@@ -21,38 +23,37 @@ def try_bool(obj: Type[Object]):
 
 
 class AndOperation(IComputable):
-    def __init__(self, left: IComputable, right: IComputable) -> None:
-        self.left = left
-        self.right = right
+    def __init__(self, *operands: IComputable) -> None:
+        self.operands = operands
 
     def eval(self, scope_path: tuple) -> Type[Object]:
-        left_obj = self.left.eval(scope_path)
-        left_bool = try_bool(left_obj)
-        if not left_bool.value:
-            return left_obj
-        return self.right.eval(scope_path)
+        for operand in self.operands[:-1]:
+            obj = operand.eval(scope_path)
+            if not try_bool(obj).value:
+                return obj
+        return self.operands[-1].eval(scope_path)
 
 
 class OrOperation(IComputable):
-    def __init__(self, left: IComputable, right: IComputable) -> None:
-        self.left = left
-        self.right = right
+    def __init__(self, *operands: IComputable) -> None:
+        self.operands = operands
 
     def eval(self, scope_path: tuple) -> Type[Object]:
-        left_obj = self.left.eval(scope_path)
-        left_bool = try_bool(left_obj)
-        if left_bool.value:
-            return left_obj
-        return self.right.eval(scope_path)
+        for operand in self.operands[:-1]:
+            obj = operand.eval(scope_path)
+            if try_bool(obj).value:
+                return obj
+        return self.operands[-1].eval(scope_path)
 
 
 class NotOperation(IComputable):
-    def __init__(self, value: IComputable) -> None:
+    def __init__(self, value: IComputable, negated: bool = True) -> None:
         self.value = value
+        self.negated = negated  # False for an even number of nots, which only converts to bool
 
     def eval(self, scope_path: tuple) -> Type[Object]:
         obj = self.value.eval(scope_path)
-        return Bool(not try_bool(obj).value)
+        return Bool(bool(try_bool(obj).value) != self.negated)
 
 
 def bool_constructor(this: Bool, arg: Type[Object]):
@@ -1,37 +1,54 @@
 from .base import Class, forward_declarations, register_class
 from .base import to_primitive_function, IPrimitiveType, Object, create_none
+from .base import register_operator
 from .logic import Bool
 from typing import Union, Callable, Type
 from functools import wraps
+from itertools import product
+import operator
 
 
 class Numerical(IPrimitiveType):
-    def __init__(self, value: Union[int, float], *args, **kwargs) -> None:
-        self.value = value
-        super().__init__(*args, **kwargs)
+    __slots__ = ('value',)
+    primitive_class = None  # The int/float Class, set once it exists
+
+    def __new__(cls, value: Union[int, float] = 0) -> "Numerical":
+        this = super().__new__(cls, value)
+        this.value = value
+        this.type = cls.primitive_class  # Object.__init__'s fields, set here to skip the __init__ chain
+        this.attributes = {}
+        this.is_return = False
+        return this
+
+    def __init__(self, value: Union[int, float] = 0) -> None:
+        pass
 
 
 class Int(Numerical):
-    def __init__(self, value: int = 0) -> None:
-        super().__init__(value, int_class)
+    __slots__ = ()
 
 
 class Float(Numerical):
-    def __init__(self, value: float = 0) -> None:
-        super().__init__(value, float_class)
+    __slots__ = ()
+
+
+numerical_boxes = {
+    int:    Int,
+    float:  Float,
+    bool:   Bool
+}
 
 
 def numerical_compatible(fn: Callable):
+    boxes = numerical_boxes  # Not a default argument: to_primitive_function would expose it
+
     @wraps(fn)
     def numerical_compatible_fn(this: Int, other):
         assert(type(other) in [Int, Float, Bool])
         result = fn(this.value, other.value)
-        if type(result) is int:
-            return Int(result)
-        elif type(result) is float:
-            return Float(result)
-        elif type(result) is bool:
-            return Bool(result)
+        box = boxes.get(type(result))
+        if box is not None:
+            return box(result)
     return numerical_compatible_fn
 
 
@@ -66,18 +83,18 @@ def static_float_call(this: Class, arg: Type[Object]) -> Float:
 
 
 numerical_methods = {
-    "#add":                 (lambda x, y: x + y),
-    "#substract_left":      (lambda x, y: x - y),
-    "#multiply":            (lambda x, y: x * y),
-    "#divide_left":         (lambda x, y: x / y),
-    "#modulo_left":         (lambda x, y: x % y),
-    "#exponent_left":       (lambda x, y: x ** y),
-    "#equal":               (lambda x, y: x == y),
-    "#not_equal":           (lambda x, y: x != y),
-    "#lesser_left":         (lambda x, y: x < y),
-    "#lesser_equal_left":   (lambda x, y: x <= y),
-    "#greater_left":        (lambda x, y: x > y),
-    "#greater_equal_left":  (lambda x, y: x >= y),
+    "#add":                 operator.add,
+    "#substract_left":      operator.sub,
+    "#multiply":            operator.mul,
+    "#divide_left":         operator.truediv,
+    "#modulo_left":         operator.mod,
+    "#exponent_left":       operator.pow,
+    "#equal":               operator.eq,
+    "#not_equal":           operator.ne,
+    "#lesser_left":         operator.lt,
+    "#lesser_equal_left":   operator.le,
+    "#greater_left":        operator.gt,
+    "#greater_equal_left":  operator.ge,
     "#substract_right":     (lambda x, y: y - x),
     "#divide_right":        (lambda x, y: y / x),
     "#modulo_right":        (lambda x, y: y % x),
@@ -89,29 +106,68 @@ numerical_methods = {
 
 }
 
-int_methods = {name: to_primitive_function(numerical_compatible(method))
-               for name, method in numerical_methods.items()}
+shared_methods = {name: to_primitive_function(numerical_compatible(method))
+                  for name, method in numerical_methods.items()}
+shared_methods["#to_bool"] = to_primitive_function(numerical_to_bool)
+shared_methods["#hash"] = to_primitive_function(numerical_hash)
+shared_methods["#to_string"] = to_primitive_function(numerical_to_string)
+
+int_methods = dict(shared_methods)
 int_methods["constructor"] = to_primitive_function(int_constructor)
-int_methods["#to_bool"] = to_primitive_function(numerical_to_bool)
-int_methods["#hash"] = to_primitive_function(numerical_hash)
-int_methods["#to_string"] = to_primitive_function(numerical_to_string)
 
 
 int_class = Class("int", int_methods, {
     "#call":        to_primitive_function(static_int_call)
 })
 
-float_methods = {name: to_primitive_function(numerical_compatible(method))
-                 for name, method in numerical_methods.items()}
+float_methods = dict(shared_methods)
 float_methods["constructor"] = to_primitive_function(float_constructor)
-float_methods["#to_bool"] = to_primitive_function(numerical_to_bool)
-float_methods["#hash"] = to_primitive_function(numerical_hash)
-float_methods["#to_string"] = to_primitive_function(numerical_to_string)
 
 
 float_class = Class("float", float_methods, {
     "#call":        to_primitive_function(static_float_call)
 })
 
+Int.primitive_class = int_class
+Float.primitive_class = float_class
+
 register_class("int", Int, int_class)
 register_class("float", Float, float_class)
+
+
+fast_operators = {name[:-len("_left")] if name.endswith("_left") else name: method
+                  for name, method in numerical_methods.items()
+                  if not name.endswith("_right")}  # The fast paths see the left operand as this
+
+comparation_method_names = ("#equal", "#not_equal", "#lesser", "#lesser_equal", "#greater", "#greater_equal")
+
+
+def specialize(op: Callable, result_type: Type[IPrimitiveType]) -> Callable:
+    def specialized(this, other):
+        return result_type(op(this.value, other.value))
+    return specialized
+
+
+def or_none(fn: Callable) -> Callable:  # Fast paths skip PrimitiveCall, which turns a None result into null
+    def or_none_fn(this, other):
+        result = fn(this, other)
+        return result if result is not None else create_none()
+    return or_none_fn
+
+
+def specialized_result_type(name: str, left_type, right_type):
+    if name in comparation_method_names:
+        return Bool
+    if name == "#divide" or Float in (left_type, right_type):
+        return Float
+    return Int
+
+
+for (name, op), (left_type, right_type) in product(fast_operators.items(), product((Int, Float, Bool), repeat=2)):
+    if left_type is Bool and right_type is Bool:
+        continue
+    if name == "#exponent":  # The result type depends on the sign of the exponent
+        register_operator(name, left_type, right_type, or_none(numerical_compatible(op)))
+    else:
+        register_operator(name, left_type, right_type,
+                          specialize(op, specialized_result_type(name, left_type, right_type)))
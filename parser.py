@@ -1,95 +1,267 @@
 from AST.base import ClassCreate, FunctionCreate, Assignment, Variable, MemberCall
 from AST.base import IAssignable, FunctionCall, OperatorCall, MemberAccess, ParentCall
 from AST.base import ConstructorCall, UnpackOperation, Constant, Destructuring
+from AST.base import NaryOperatorCall, FoldedConstant, walk, transform
 from AST.statements import StatementList, ExprStatement, ReturnStatement
 from AST.exceptions import RaiseStatement
 from AST.logic import NotOperation, OrOperation, AndOperation
 from AST.flow_control import BreakStatement, ContinueStatement, ConditionalExpression
 from AST.flow_control import ConditionalStatement, WhileStatement, ForStatement
 from AST.flow_control import ListComprehensionConstant, ContainsOperation
-from AST.numerical import Int, Float
+from AST.numerical import Int, Float, numerical_methods
+from AST.logic import Bool
 from AST.collection_types import ItemAccess, TupleConstant, ArrayConstant, DictionaryConstant
 from AST.text import String
-from typing import Any
+import sys
 
-from tokenizer import Tokenizer, TokenType
+from tokenizer import tokenize, TokenType
 import builtin_functions
 
 
+_folded_types = {int: Int, float: Float, bool: Bool}
+
+_max_folded_bits = 4096  # Larger int results are left for the evaluator, as computing them may be slow
+
+
+def _bounded_result(name, x, y):  # Whether the exact result of x <name> y is cheap to compute at parse time
+    if not (isinstance(x, int) and isinstance(y, int)):
+        return True
+    if name == "#exponent":
+        return y < 0 or x.bit_length() * y <= _max_folded_bits
+    if name == "#multiply":
+        return x.bit_length() + y.bit_length() <= _max_folded_bits
+    return True
+
+
+def _fold_binop(name, a, b):
+    if not (isinstance(a, Constant) and isinstance(b, Constant)):
+        return OperatorCall(name, [a, b])
+    x, y = a.value, b.value
+    if (type(x) not in (Int, Float, Bool) or type(y) not in (Int, Float, Bool) or
+       type(x) is Bool and type(y) is Bool):
+        return OperatorCall(name, [a, b])
+    if not _bounded_result(name, x.value, y.value):
+        return OperatorCall(name, [a, b])
+    method = numerical_methods.get(name + "_left", numerical_methods.get(name))
+    try:
+        result = method(x.value, y.value)
+    except ArithmeticError:  # Left for the evaluator to raise
+        return OperatorCall(name, [a, b])
+    if type(result) not in _folded_types:
+        return OperatorCall(name, [a, b])
+    return FoldedConstant(_folded_types[type(result)](result))
+
+
+def _fold_chain(names, operands):  # Only a constant prefix is folded, operators needn't be associative
+    value, i = operands[0], 0
+    while i < len(names):
+        folded = _fold_binop(names[i], value, operands[i + 1])
+        if not isinstance(folded, Constant):
+            break
+        value, i = folded, i + 1
+    if i == len(names):
+        return value
+    if i == len(names) - 1:
+        return OperatorCall(names[i], [value, operands[i + 1]])
+    return NaryOperatorCall(names[i:], [value] + operands[i + 1:])
+
+
+def _fold_and(operands):
+    folded = []
+    for operand in operands[:-1]:
+        if isinstance(operand, Constant) and type(operand.value) is Bool:
+            if not operand.value.value:
+                folded.append(operand)
+                break
+        else:
+            folded.append(operand)
+    else:
+        folded.append(operands[-1])
+    return folded[0] if len(folded) == 1 else AndOperation(*folded)
+
+
+def _fold_conditional(condition, if_expr, else_expr):
+    if isinstance(condition, Constant) and type(condition.value) is Bool:
+        return if_expr if condition.value.value else else_expr
+    return ConditionalExpression(condition, if_expr, else_expr)
+
+
+def _refold(node):
+    if type(node) is OperatorCall and len(node.arguments) == 2:
+        return _fold_binop(node.name, *node.arguments)
+    if type(node) is NaryOperatorCall:
+        return _fold_chain(node.names, list(node.operands))
+    if type(node) is AndOperation:
+        return _fold_and(list(node.operands))
+    if type(node) is ConditionalExpression and node.if_expr is not None:
+        return _fold_conditional(node.condition, node.if_expr, node.else_expr)
+    return node
+
+
+def _returned_expr(body):  # The expression of a body made of a single return statement
+    if type(body) is StatementList and len(body.statements) == 1:
+        body = body.statements[0]
+    if type(body) is ReturnStatement and type(body.value) is ExprStatement:
+        return body.value.expression
+    return None
+
+
+def _bound_names(tree):
+    names = []
+    for node in walk(tree):
+        if isinstance(node, Assignment):
+            names.extend(target.name for target in walk(node.object) if type(target) is Variable)
+        elif isinstance(node, FunctionCreate):
+            names.extend(node.arg_names)
+            if node.var_arg_name is not None:
+                names.append(node.var_arg_name)
+        elif isinstance(node, ContainsOperation):
+            names.extend(target.name for target in walk(node.value) if type(target) is Variable)
+        elif isinstance(node, Destructuring):
+            names.extend(node.names)
+    return names
+
+
+def _specialize(function, constants):  # function with the given arguments replaced by their values
+    if any(name in constants for name in _bound_names(function.operation)):
+        return None  # Rebound or shadowed by an inner binder, so not always the argument
+
+    def bind(node):
+        if type(node) is Variable and node.name in constants:
+            return Constant(constants[node.name])
+        return node
+
+    default_args = [default_arg for name, default_arg in zip(reversed(function.arg_names), function.default_args)
+                    if name not in constants]  # default_args follows arg_names from the end
+    return FunctionCreate(transform(function.operation, bind),
+                          [name for name in function.arg_names if name not in constants],
+                          function.var_arg_name,
+                          default_args=default_args)
+
+
+comparation_operators = frozenset(('==', '!=', '<', '<=', '>', '>='))
+term_operators = frozenset(('+', '-'))
+factor_operators = frozenset(('*', '/', '%'))
+
+operator_names = {symbol: sys.intern(name) for symbol, name in {
+    '==':   "#equal",
+    '!=':   "#not_equal",
+    '<':    "#lesser",
+    '<=':   "#lesser_equal",
+    '>':    "#greater",
+    '>=':   "#greater_equal",
+    'in':   "#contains",
+    '+':    "#add",
+    '-':    "#substract",
+    '*':    "#multiply",
+    '/':    "#divide",
+    '%':    "#modulo",
+    '^':    "#exponent"
+}.items()}
+
+comparation_names = {symbol: operator_names[symbol] for symbol in comparation_operators}
+term_names = {symbol: operator_names[symbol] for symbol in term_operators}
+factor_names = {symbol: operator_names[symbol] for symbol in factor_operators}
+
+
 class Parser:
 
-    comparation_operators = ('==', '!=', '<', '<=', '>', '>=')
-
-    operator_names = {
-        '==':   "#equal",
-        '!=':   "#not_equal",
-        '<':    "#lesser",
-        '<=':   "#lesser_equal",
-        '>':    "#greater",
-        '>=':   "#greater_equal",
-        'in':   "#contains",
-        '+':    "#add",
-        '-':    "#substract",
-        '*':    "#multiply",
-        '/':    "#divide",
-        '%':    "#modulo",
-        '^':    "#exponent"
-    }
+    comparation_operators = comparation_operators
+
+    operator_names = operator_names
 
     def __init__(self, text):
-        self.tokens = Tokenizer(text).get_token_list()
+        tokens = tokenize(text)  # Always ends with an EOF token
+        self.token_types = [token.type for token in tokens]
+        self.token_values = [token.value for token in tokens]
         self.pos = 0
+        self.token_type = self.token_types[0]
+        self.token_value = self.token_values[0]
+        self.atom_handlers = {
+            TokenType.KEYWORD:  self.atom_keyword,
+            TokenType.INT:      self.atom_int,
+            TokenType.FLOAT:    self.atom_float,
+            TokenType.NAME:     self.atom_name,
+            TokenType.STRING:   self.atom_string,
+            TokenType.LPAREN:   self.atom_group,
+            TokenType.LBRACK:   self.atom_array,
+            TokenType.LBRACE:   self.atom_dict,
+            TokenType.ELLIPSIS: self.atom_unpack
+        }
+        self.atom_keywords = {
+            "new":      self.atom_new,
+            "null":     self.atom_null,
+            "parent":   self.atom_parent
+        }
 
     def error(self, message=""):
-        raise SyntaxError(f"On {self.token} at pos {self.pos}:\n\t{message}")
-
-    @property
-    def token(self):
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        self.pos -= 1
-        self.error("Unexpected EOF")
-
-    @property
-    def next_token(self):
-        if self.pos < len(self.tokens) - 1:
-            return self.tokens[self.pos + 1]
-        self.error("Unexpected EOF")
-
-    @property
-    def prev_token(self):
-        if self.pos > 0:
-            return self.tokens[self.pos - 1]
-        self.error("Expected previous token")
-
-    def eat(self, type: TokenType, value: Any = None):
-        if self.token.type != type or (value is not None and self.token.value != value):
-            self.error(f"Expected {type}" + (f" of value {value}" if value is not None else ""))
-        else:
-            value = self.token.value
-            self.pos += 1
-            return value
+        raise SyntaxError(f"On Token({self.token_type}, {self.token_value}) at pos {self.pos}:\n\t{message}")
+
+    def eat(self, type: TokenType):
+        if self.token_type != type:
+            self.error(f"Expected {type}")
+        value = self.token_value
+        self.pos += 1
+        self.token_type = self.token_types[self.pos]
+        self.token_value = self.token_values[self.pos]
+        return value
 
     def find_next(self, type: TokenType):
-        start_pos = self.pos
-        while self.token.type != type:
-            self.pos += 1
-        result = self.pos
-        self.pos = start_pos
-        return result
+        try:
+            return self.token_types.index(type, self.pos)
+        except ValueError:
+            self.error("Unexpected EOF")
 
     def statement_block(self):
-        if self.token.value != '{':
+        if self.token_type != TokenType.LBRACE:
             return self.statement()
-        self.eat(TokenType.GROUP)
+        self.eat(TokenType.LBRACE)
         result = self.statement_list()
-        self.eat(TokenType.GROUP, '}')
+        self.eat(TokenType.RBRACE)
         return result
 
+    def program(self):
+        return self.specialize_calls(self.statement_list())
+
+    def specialize_calls(self, tree):
+        bound_names = _bound_names(tree)
+        functions = {}  # Only functions defined by an earlier statement exist when a statement runs
+        specializations = {}
+
+        def specialize_call(node):
+            if (type(node) is not FunctionCall or
+               type(node.function) is not Variable or
+               node.function.name not in functions or
+               node.kwargs.lines or
+               len(node.args) != len(functions[node.function.name].arg_names) or
+               not all(type(arg) is Constant and type(arg.value) in (Int, Float, Bool, String) for arg in node.args)):
+                return node
+            key = (node.function.name, tuple((type(arg.value), arg.value.value) for arg in node.args))
+            if key not in specializations:
+                function = functions[node.function.name]
+                specialized = _specialize(function, {name: arg.value for name, arg in zip(function.arg_names, node.args)})
+                expr = _returned_expr(specialized.operation) if specialized is not None else None
+                specializations[key] = transform(expr, _refold) if expr is not None else None
+            result = specializations[key]
+            if not isinstance(result, Constant):
+                return node
+            return FoldedConstant(result.value)  # Boxes a new object on every eval, as the call did
+
+        statements = []
+        for statement in tree.statements:
+            statements.append(transform(statement, specialize_call) if functions else statement)
+            if (isinstance(statement, Assignment) and
+               type(statement.object) is Variable and
+               type(statement.value) is FunctionCreate and
+               statement.value.var_arg_name is None and
+               bound_names.count(statement.object.name) == 1):
+                functions[statement.object.name] = statement.value
+        return StatementList(statements)
+
     def statement_list(self):
         s = self.statement()
         result = [s] if s is not None else []
-        while self.token.value != '}' and self.token.type != TokenType.EOF:
+        while self.token_type != TokenType.RBRACE and self.token_type != TokenType.EOF:
             s = self.statement()
             if s is not None:
                 result.append(s)
@@ -99,82 +271,83 @@ class Parser:
         return self.class_statement()
 
     def class_statement(self):
-        if self.token.value == "class":
+        if self.token_value == "class":
             self.eat(TokenType.KEYWORD)
             name = self.eat(TokenType.NAME)
-            if self.token.value == "extends":
+            if self.token_value == "extends":
                 self.eat(TokenType.KEYWORD)
                 parent_name = self.eat(TokenType.NAME)
             else:
                 parent_name = None
             methods = {}
             statics = {}
-            self.eat(TokenType.GROUP, '{')
-            while self.token.value != '}':
-                if self.token.value == "static":
+            self.eat(TokenType.LBRACE)
+            while self.token_type != TokenType.RBRACE:
+                if self.token_value == "static":
                     self.eat(TokenType.KEYWORD)
                     definition = self.function_statement()
                     statics[definition.object.name] = definition.value
-                elif self.token.value == "function":
+                elif self.token_value == "function":
                     definition = self.function_statement()
                     methods[definition.object.name] = definition.value
                 else:
                     assignment = self.assignment()
                     statics[assignment.object.name] = assignment.value
-            self.eat(TokenType.GROUP)
+            self.eat(TokenType.RBRACE)
             return Assignment(Variable(name), ClassCreate(name, methods, statics, parent_name))
         return self.function_statement()
 
     def function_statement(self):
-        if self.token.value == "function":
+        if self.token_value == "function":
             self.eat(TokenType.KEYWORD)
             name = self.eat(TokenType.NAME)
             var_arg_name = None
             default_args = []
-            self.eat(TokenType.GROUP, '(')
-            if self.token.type == TokenType.ELLIPSIS:
+            self.eat(TokenType.LPAREN)
+            if self.token_type == TokenType.ELLIPSIS:
                 self.eat(TokenType.ELLIPSIS)
                 names = []
                 var_arg_name = self.eat(TokenType.NAME)
-            elif self.token.type == TokenType.NAME:
+            elif self.token_type == TokenType.NAME:
                 names = [self.eat(TokenType.NAME)]
-                if self.token.value == '=':
+                if self.token_value == '=':
                     self.eat(TokenType.OPERATOR)
                     default_args.append(self.expr())
-                while self.token.type == TokenType.COMMA:
+                while self.token_type == TokenType.COMMA:
                     self.eat(TokenType.COMMA)
-                    if self.token.type == TokenType.ELLIPSIS:
+                    if self.token_type == TokenType.ELLIPSIS:
                         self.eat(TokenType.ELLIPSIS)
                         var_arg_name = self.eat(TokenType.NAME)
                         break
                     else:
                         names.append(self.eat(TokenType.NAME))
-                        if self.token.value == '=':
+                        if self.token_value == '=':
                             self.eat(TokenType.OPERATOR)
                             default_args.append(self.expr())
             else:
                 names = []
-            self.eat(TokenType.GROUP, ')')
+            self.eat(TokenType.RPAREN)
             body = self.statement_block()
+            default_args.reverse()
             return Assignment(Variable(name),
                               FunctionCreate(body,
                                              names,
                                              var_arg_name,
-                                             default_args=default_args[::-1]))
+                                             default_args=default_args))
         return self.special_statement()
 
     def special_statement(self):
-        if self.token.value == "return":
+        if self.token_value == "return":
             self.eat(TokenType.KEYWORD)
             return ReturnStatement(self.expr_statement())
-        if self.token.value == "raise":
+        if self.token_value == "raise":
             self.eat(TokenType.KEYWORD)
             return RaiseStatement(self.expr_statement())
-        if self.token.value == "break":
+        if self.token_value == "break":
             self.eat(TokenType.KEYWORD)
             self.eat(TokenType.SEMICOLON)
             return BreakStatement()
-        if self.token.value == "continue":
+        if self.token_value == "continue":
             self.eat(TokenType.KEYWORD)
             self.eat(TokenType.SEMICOLON)
             return ContinueStatement()
@@ -182,37 +355,37 @@ class Parser:
 
     def name_list(self):
         names = [self.eat(TokenType.NAME)]
-        while self.token.type == TokenType.COMMA:
+        while self.token_type == TokenType.COMMA:
             self.eat(TokenType.COMMA)
             names.append(self.eat(TokenType.NAME))
         return names
 
     def flow_statement(self):
-        if self.token.type == TokenType.KEYWORD:
-            if self.token.value == "if":
+        if self.token_type == TokenType.KEYWORD:
+            if self.token_value == "if":
                 self.eat(TokenType.KEYWORD)
-                self.eat(TokenType.GROUP, '(')
+                self.eat(TokenType.LPAREN)
                 condition = self.expr()
-                self.eat(TokenType.GROUP, ')')
+                self.eat(TokenType.RPAREN)
                 body = self.statement_block()
-                if self.token.value == "else":
+                if self.token_value == "else":
                     self.eat(TokenType.KEYWORD)
                     else_body = self.statement_block()
                 else:
                     else_body = None
                 return ConditionalStatement(condition, body, else_body)
-            if self.token.value == "while":
+            if self.token_value == "while":
                 self.eat(TokenType.KEYWORD)
-                self.eat(TokenType.GROUP, '(')
+                self.eat(TokenType.LPAREN)
                 condition = self.expr()
-                self.eat(TokenType.GROUP, ')')
+                self.eat(TokenType.RPAREN)
                 body = self.statement_block()
                 return WhileStatement(condition, body)
-            if self.token.value == "for":
+            if self.token_value == "for":
                 self.eat(TokenType.KEYWORD)
-                self.eat(TokenType.GROUP, '(')
+                self.eat(TokenType.LPAREN)
                 head = self.expr()
-                self.eat(TokenType.GROUP, ')')
+                self.eat(TokenType.RPAREN)
                 body = self.statement_block()
                 return ForStatement(head, body)
         return self.expr_statement()
@@ -227,7 +400,7 @@ class Parser:
 
     def assignment_expr(self):
         var = self.list_comp_expr()
-        if self.token.value == '=':
+        if self.token_value == '=':
             assert(isinstance(var, IAssignable))
             self.eat(TokenType.OPERATOR)
             expr = self.assignment_expr()
@@ -236,10 +409,10 @@ class Parser:
 
     def list_comp_expr(self):
         operation = self.conditional_expr()
-        if self.token.value == "for":
+        if self.token_value == "for":
             self.eat(TokenType.KEYWORD)
             head = self.expr()
-            if self.token.type == TokenType.COMMA:
+            if self.token_type == TokenType.COMMA:
                 conditions = self.expr_list()
             else:
                 conditions = []
@@ -248,234 +421,250 @@ class Parser:
 
     def conditional_expr(self):
         condition = self.or_expr()
-        if self.token.type == TokenType.QUESTION:
+        if self.token_type == TokenType.QUESTION:
             self.eat(TokenType.QUESTION)
             if_expr = self.expr()
             self.eat(TokenType.COLON)
             else_expr = self.expr()
-            return ConditionalExpression(condition, if_expr, else_expr)
+            return _fold_conditional(condition, if_expr, else_expr)
         return condition
 
     def or_expr(self):
-        value = self.and_expr()
-        while self.token.value == "or":
+        operands = [self.and_expr()]
+        while self.token_value == "or":
             self.eat(TokenType.OPERATOR)
-            value = OrOperation(value, self.and_expr())
-        return value
+            operands.append(self.and_expr())
+        return operands[0] if len(operands) == 1 else OrOperation(*operands)
 
     def and_expr(self):
-        value = self.not_expr()
-        while self.token.value == "and":
+        operands = [self.not_expr()]
+        while self.token_value == "and":
             self.eat(TokenType.OPERATOR)
-            value = AndOperation(value, self.not_expr())
-        return value
+            operands.append(self.not_expr())
+        return operands[0] if len(operands) == 1 else AndOperation(*operands)
 
     def not_expr(self):
-        if self.token.value == "not":
+        count = 0
+        while self.token_value == "not":
             self.eat(TokenType.OPERATOR)
-            return NotOperation(self.not_expr())
-        return self.in_expr()
+            count += 1
+        value = self.in_expr()
+        if count == 0:
+            return value
+        if isinstance(value, Constant) and type(value.value) is Bool:
+            return FoldedConstant(Bool(value.value.value != bool(count & 1)))
+        return NotOperation(value, negated=bool(count & 1))
 
     def in_expr(self):
         value = self.comparation_expr()
-        if self.token.value == "in":
+        if self.token_value == "in":
             self.eat(TokenType.KEYWORD)
             return ContainsOperation(value, self.expr())
         return value
 
-    def comparation_expr(self):
+    def comparation_expr(self, _operators=comparation_operators, _names=comparation_names):
         value = self.term_expr()
-        if self.token.value in Parser.comparation_operators:
-            operator = self.token.value
+        operator = self.token_value
+        if operator in _operators:
             self.eat(TokenType.OPERATOR)
             last_operand = self.term_expr()
-            value = OperatorCall(Parser.operator_names[operator], [value, last_operand])
-            while self.token.value in Parser.comparation_operators:  # Allows a < x < b
-                operator = self.token.value
+            comparations = [_fold_binop(_names[operator], value, last_operand)]
+            operator = self.token_value
+            while operator in _operators:  # Allows a < x < b
                 self.eat(TokenType.OPERATOR)
                 op = self.term_expr()
-                value = AndOperation(value, OperatorCall(Parser.operator_names[operator], [last_operand, op]))
+                comparations.append(_fold_binop(_names[operator], last_operand, op))
                 last_operand = op
+                operator = self.token_value
+            return _fold_and(comparations)
         return value
 
-    def term_expr(self):
-        value = self.factor_expr()
-        while self.token.value in ('+', '-'):
-            operator = self.token.value
+    def term_expr(self, _operators=term_operators, _names=term_names):
+        operands = [self.factor_expr()]
+        names = []
+        operator = self.token_value
+        while operator in _operators:
             self.eat(TokenType.OPERATOR)
-            value = OperatorCall(Parser.operator_names[operator], [value, self.factor_expr()])
-        return value
-
-    def factor_expr(self):
-        value = self.power_expr()
-        while self.token.value in ('*', '/', '%'):
-            operator = self.token.value
+            names.append(_names[operator])
+            operands.append(self.factor_expr())
+            operator = self.token_value
+        return _fold_chain(names, operands)
+
+    def factor_expr(self, _operators=factor_operators, _names=factor_names):
+        operands = [self.power_expr()]
+        names = []
+        operator = self.token_value
+        while operator in _operators:
             self.eat(TokenType.OPERATOR)
-            value = OperatorCall(Parser.operator_names[operator], [value, self.power_expr()])
-        return value
+            names.append(_names[operator])
+            operands.append(self.power_expr())
+            operator = self.token_value
+        return _fold_chain(names, operands)
 
-    def power_expr(self):
+    def power_expr(self, _name=operator_names['^']):
         value = self.trailer_expr()
-        while self.token.value == '^':
+        while self.token_value == '^':
             self.eat(TokenType.OPERATOR)
-            value = OperatorCall("#exponent", [value, self.trailer_expr()])
+            value = _fold_binop(_name, value, self.trailer_expr())
         return value
 
     def expr_list(self, *, with_kwargs=False):
-        start_symbol = self.token.value
+        start_type = self.token_type
         result = [self.expr()]
         kwarg_lines = []
 
         if result[0] is None:
             result = []
 
-        if self.token.value == ')':
+        if self.token_type == TokenType.RPAREN:
             if (len(result) == 1 and
                with_kwargs and
                isinstance(result[-1], Assignment) and
                isinstance(result[-1].object, Variable) and
-               start_symbol != '('):
+               start_type != TokenType.LPAREN):
                 kv_pair = result.pop()
                 kwarg_lines.append(Constant(String(kv_pair.object.name)), kv_pair.value)
 
-        while self.token.type == TokenType.COMMA:
+        while self.token_type == TokenType.COMMA:
             if (with_kwargs and
                isinstance(result[-1], Assignment) and
                isinstance(result[-1].object, Variable) and
-               start_symbol != '('):
+               start_type != TokenType.LPAREN):
                 kv_pair = result.pop()
                 kwarg_lines.append(Constant(String(kv_pair.object.name)), kv_pair.value)
-            if self.token.type == TokenType.COMMA:
+            if self.token_type == TokenType.COMMA:
                 self.eat(TokenType.COMMA)
-                start_symbol = self.token.value
+                start_type = self.token_type
                 result.append(self.expr())
 
         return result if not with_kwargs else (result, DictionaryConstant(kwarg_lines))
 
     def trailer_expr(self):
         value = self.atom()
-        while self.token.value in ('(', '[') or self.token.type == TokenType.DOT:
-            if self.token.type == TokenType.DOT:
+        while self.token_type in (TokenType.LPAREN, TokenType.LBRACK, TokenType.DOT):
+            if self.token_type == TokenType.DOT:
                 self.eat(TokenType.DOT)
                 value = MemberAccess(value, self.eat(TokenType.NAME))
-            if self.token.value == '(':
-                self.eat(TokenType.GROUP)
+            if self.token_type == TokenType.LPAREN:
+                self.eat(TokenType.LPAREN)
                 args, kwargs = self.expr_list(with_kwargs=True)
-                self.eat(TokenType.GROUP, ')')
+                self.eat(TokenType.RPAREN)
                 if isinstance(value, MemberAccess):
                     value = MemberCall(value.object, value.name, args, kwargs)
                 else:
                     value = FunctionCall(value, args, kwargs)
-            if self.token.value == '[':
-                self.eat(TokenType.GROUP)
+            if self.token_type == TokenType.LBRACK:
+                self.eat(TokenType.LBRACK)
                 arguments = self.expr_list()
-                self.eat(TokenType.GROUP, ']')
+                self.eat(TokenType.RBRACK)
                 value = ItemAccess(value, arguments)
         return value
 
     def atom(self):
-        token = self.token
-
-        if token.value == "new":
-            self.eat(TokenType.KEYWORD)
-            type = self.atom()
-            self.eat(TokenType.GROUP, '(')
-            args, kwargs = self.expr_list(with_kwargs=True)
-            self.eat(TokenType.GROUP, ')')
-            return ConstructorCall(type, args, kwargs)
-
-        if token.type == TokenType.KEYWORD:
-            if token.value == "null":
-                self.eat(TokenType.KEYWORD)
-                return ConstructorCall(Variable("NoneType"), [])
-            if token.value == "parent":
-                self.eat(TokenType.KEYWORD)
-                self.eat(TokenType.DOT)
-                name = self.eat(TokenType.NAME)
-                self.eat(TokenType.GROUP, '(')
-                args, kwargs = self.expr_list(with_kwargs=True)
-                self.eat(TokenType.GROUP, ')')
-                return ParentCall(name, args, kwargs)
-
-        if token.type == TokenType.INT:
-            self.eat(TokenType.INT)
-            return Constant(Int(token.value))
-
-        if token.type == TokenType.FLOAT:
-            self.eat(TokenType.FLOAT)
-            return Constant(Float(token.value))
-
-        if token.type == TokenType.NAME:
-            self.eat(TokenType.NAME)
-            return Variable(token.value)
+        handler = self.atom_handlers.get(self.token_type)
+        return handler() if handler is not None else None
+
+    def atom_keyword(self):
+        handler = self.atom_keywords.get(self.token_value)
+        return handler() if handler is not None else None
+
+    def atom_new(self):
+        self.eat(TokenType.KEYWORD)
+        type = self.atom()
+        self.eat(TokenType.LPAREN)
+        args, kwargs = self.expr_list(with_kwargs=True)
+        self.eat(TokenType.RPAREN)
+        return ConstructorCall(type, args, kwargs)
+
+    def atom_null(self):
+        self.eat(TokenType.KEYWORD)
+        return ConstructorCall(Variable("NoneType"), [])
+
+    def atom_parent(self):
+        self.eat(TokenType.KEYWORD)
+        self.eat(TokenType.DOT)
+        name = self.eat(TokenType.NAME)
+        self.eat(TokenType.LPAREN)
+        args, kwargs = self.expr_list(with_kwargs=True)
+        self.eat(TokenType.RPAREN)
+        return ParentCall(name, args, kwargs)
+
+    def atom_int(self):
+        return Constant(Int(self.eat(TokenType.INT)))
+
+    def atom_float(self):
+        return Constant(Float(self.eat(TokenType.FLOAT)))
+
+    def atom_name(self):
+        return Variable(self.eat(TokenType.NAME))
+
+    def atom_string(self):
+        return Constant(String(self.eat(TokenType.STRING)))
+
+    def atom_group(self):
+        self.eat(TokenType.LPAREN)
+        value = self.expr()
+        if self.token_type == TokenType.COMMA:
+            self.eat(TokenType.COMMA)
+            value = TupleConstant([value] + self.expr_list())
+        self.eat(TokenType.RPAREN)
+        if self.token_type == TokenType.ARROW:
+            if isinstance(value, Variable):
+                names = [value.name]
+            elif all([isinstance(val, Variable) for val in value.arguments]):
+                names = [val.name for val in value.arguments]
+            return FunctionCreate(self.statement_block(), names)
+        return value
 
-        if token.type == TokenType.STRING:
-            self.eat(TokenType.STRING)
-            return Constant(String(token.value))
+    def atom_array(self):
+        self.eat(TokenType.LBRACK)
+        value = ArrayConstant(self.expr_list())
+        self.eat(TokenType.RBRACK)
+        return value
 
-        if token.type == TokenType.GROUP:
-            if token.value == '(':
-                self.eat(TokenType.GROUP)
-                value = self.expr()
-                if self.token.type == TokenType.COMMA:
-                    self.eat(TokenType.COMMA)
-                    value = TupleConstant([value] + self.expr_list())
-                self.eat(TokenType.GROUP, ')')
-                if self.token.type == TokenType.ARROW:
-                    if isinstance(value, Variable):
-                        names = [value.name]
-                    elif all([isinstance(val, Variable) for val in value.arguments]):
-                        names = [val.name for val in value.arguments]
-                    return FunctionCreate(self.statement_block(), names)
-                return value
-
-            if token.value == '[':
-                self.eat(TokenType.GROUP)
-                value = ArrayConstant(self.expr_list())
-                self.eat(TokenType.GROUP, ']')
-                return value
-
-            if token.value == '{':
-                self.eat(TokenType.GROUP)
-                key = self.expr()
-                if isinstance(key, Variable):
-                    if self.token.type == TokenType.COMMA:
-                        self.eat(TokenType.COMMA)
-                        key = Destructuring([key.name] + self.name_list())
-                        self.eat(TokenType.GROUP, '}')
-                        return key
-                    elif self.token.key == '}':
-                        key = Destructuring([key.name])
-                        self.eat(TokenType.GROUP)
-                        return key
+    def atom_dict(self):
+        self.eat(TokenType.LBRACE)
+        key = self.expr()
+        if isinstance(key, Variable):
+            if self.token_type == TokenType.COMMA:
+                self.eat(TokenType.COMMA)
+                key = Destructuring([key.name] + self.name_list())
+                self.eat(TokenType.RBRACE)
+                return key
+            elif self.token_type == TokenType.RBRACE:
+                key = Destructuring([key.name])
+                self.eat(TokenType.RBRACE)
+                return key
+        self.eat(TokenType.COLON)
+        value = self.expr()
+        lines = [(key, value)]
+        while self.token_type == TokenType.COMMA:
+            self.eat(TokenType.COMMA)
+            key = self.expr()
+            if isinstance(key, UnpackOperation):
+                lines.append((key,))
+            else:
                 self.eat(TokenType.COLON)
                 value = self.expr()
-                lines = [(key, value)]
-                while self.token.type == TokenType.COMMA:
-                    self.eat(TokenType.COMMA)
-                    key = self.expr()
-                    if isinstance(key, UnpackOperation):
-                        lines.append((key,))
-                    else:
-                        self.eat(TokenType.COLON)
-                        value = self.expr()
-                        lines.append((key, value))
-                return DictionaryConstant(lines)
+                lines.append((key, value))
+        return DictionaryConstant(lines)
+
+    def atom_unpack(self):
+        self.eat(TokenType.ELLIPSIS)
+        return UnpackOperation(self.expr())
 
-        if token.type == TokenType.ELLIPSIS:
-            self.eat(TokenType.ELLIPSIS)
-            return UnpackOperation(self.expr())
 
-        return None
+def parse(text, rule="statement_list"):  # Not memoized: the tree's Constant nodes hold mutable objects
+    return getattr(Parser(text), rule)()
 
 
 def parse_expr(text):
-    return Parser(text).expr().eval(())
+    return parse(text, "expr").eval(())
 
 
 def parse_statement(text):
-    return Parser(text).statement().eval(())
+    return parse(text, "statement").eval(())
 
 
 def parse_program(text):
-    return Parser(text).statement_list().eval(())
+    return parse(text, "program").eval(())
@@ -1,6 +1,7 @@
 import re
 from enum import Enum
-from typing import TypeVar, List
+from typing import TypeVar, List, Tuple
+from functools import lru_cache
 
 
 class TokenType(Enum):
@@ -14,13 +15,18 @@ class TokenType(Enum):
     COMMA = 7
     SEMICOLON = 8
     DOT = 9
-    GROUP = 10
     RANGE = 11
     ELLIPSIS = 12
     COLON = 13
     QUESTION = 14
     SEPARATOR = 15
     ARROW = 16
+    LPAREN = 17
+    RPAREN = 18
+    LBRACK = 19
+    RBRACK = 20
+    LBRACE = 21
+    RBRACE = 22
 
 
 TokenValue = TypeVar("TokenValue", int, float, str)
@@ -92,11 +98,14 @@ class Tokenizer:
         "xor"
     ]
 
-    group_chars = [
-        '(', ')',
-        '[', ']',
-        '{', '}'
-    ]
+    group_chars = {
+        '(': TokenType.LPAREN,
+        ')': TokenType.RPAREN,
+        '[': TokenType.LBRACK,
+        ']': TokenType.RBRACK,
+        '{': TokenType.LBRACE,
+        '}': TokenType.RBRACE
+    }
 
     escape_chars = {
         '\\': '\\',
@@ -206,7 +215,7 @@ class Tokenizer:
                 return result
 
             if self.char in Tokenizer.group_chars:
-                result = Token(TokenType.GROUP, self.char)
+                result = Token(Tokenizer.group_chars[self.char], self.char)
                 self.advance()
                 return result
 
@@ -227,3 +236,8 @@ class Tokenizer:
             t = self.get_next_token()
 
         return result + [t]
+
+
+@lru_cache(maxsize=1024)
+def tokenize(text: str) -> Tuple[Token, ...]:
+    return tuple(Tokenizer(text).get_token_list())